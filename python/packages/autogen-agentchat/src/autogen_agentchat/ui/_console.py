@@ -2,8 +2,24 @@ import asyncio
 import os
 import sys
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from inspect import iscoroutinefunction
-from typing import AsyncGenerator, Awaitable, Callable, Dict, List, Optional, TypeVar, Union, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from autogen_core import CancellationToken
 from autogen_core.models import RequestUsage
@@ -19,10 +35,12 @@ from autogen_agentchat.messages import (
 )
 
 
+@lru_cache(maxsize=1)
 def _is_running_in_iterm() -> bool:
     return os.getenv("TERM_PROGRAM") == "iTerm.app"
 
 
+@lru_cache(maxsize=1)
 def _is_output_a_tty() -> bool:
     return sys.stdout.isatty()
 
@@ -38,6 +56,9 @@ class UserInputManager:
     def __init__(self, callback: InputFuncType):
         self.input_events: Dict[str, asyncio.Event] = {}
         self.callback = callback
+        # The callback never changes, so inspect it once here instead of
+        # on every input request.
+        self._callback_is_async = iscoroutinefunction(callback)
 
     def get_wrapped_callback(self) -> AsyncInputFunc:
         async def user_input_func_wrapper(prompt: str, cancellation_token: Optional[CancellationToken]) -> str:
@@ -55,7 +76,7 @@ class UserInputManager:
 
             del self.input_events[request_id]
 
-            if iscoroutinefunction(self.callback):
+            if self._callback_is_async:
                 # Cast to AsyncInputFunc for proper typing
                 async_func = cast(AsyncInputFunc, self.callback)
                 return await async_func(prompt, cancellation_token)
@@ -68,15 +89,106 @@ class UserInputManager:
         return user_input_func_wrapper
 
     def notify_event_received(self, request_id: str) -> None:
-        if request_id in self.input_events:
-            self.input_events[request_id].set()
-        else:
-            event = asyncio.Event()
-            self.input_events[request_id] = event
+        event = self.input_events.setdefault(request_id, asyncio.Event())
+        event.set()
+
+
+# Console output is inherently serial (one stdout), so printing gets its
+# own single worker rather than fanning out over the default executor,
+# where concurrent Console runs would contend on the stream.
+_PRINT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="console-print")
 
 
 def aprint(output: str, end: str = "\n", flush: bool = False) -> Awaitable[None]:
-    return asyncio.to_thread(print, output, end=end, flush=flush)
+    return asyncio.get_running_loop().run_in_executor(_PRINT_EXECUTOR, partial(print, output, end=end, flush=flush))
+
+
+# Number of streaming chunks to coalesce into a single print call. Each
+# print is dispatched to a worker thread, so printing token-sized chunks
+# one at a time pays a thread-pool round-trip per token.
+_STREAMING_CHUNK_BATCH_SIZE = 16
+
+
+_ItemT = TypeVar("_ItemT")
+
+
+async def _buffered(source: AsyncIterable[_ItemT], maxsize: int = 4) -> AsyncGenerator[Tuple[_ItemT, bool], None]:
+    # Prefetch up to ``maxsize`` items from the source in a background task
+    # so the producer (e.g. an agent awaiting a model response) can run
+    # ahead while the consumer is still rendering the previous item.
+    # Yields ``(item, more_ready)`` pairs, where ``more_ready`` tells the
+    # consumer whether another item is already queued — i.e. whether it can
+    # keep batching or should flush now because the stream has drained.
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+    done = object()
+
+    async def pump() -> None:
+        # The sentinel is deliberately not sent from a finally block: when
+        # the consumer dies it cancels this task and stops draining the
+        # queue, so a blocking put of the sentinel on a full queue would
+        # never complete and the task would hang event-loop shutdown.
+        try:
+            async for item in source:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            # The consumer is still draining and waits for the sentinel
+            # before re-raising this via ``await task``.
+            await queue.put(done)
+            raise
+        else:
+            await queue.put(done)
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            yield cast(_ItemT, item), not queue.empty()
+        # Re-raise any exception from the source.
+        await task
+    finally:
+        task.cancel()
+
+
+@lru_cache(maxsize=64)
+def _type_name(message_type: type) -> str:
+    # A run only sees a handful of message types; skip the repeated
+    # __class__.__name__ attribute walk per message.
+    return message_type.__name__
+
+
+_TO_TEXT_CACHE: Dict[int, Tuple["weakref.ref[Any]", Dict[bool, str]]] = {}
+
+
+def _message_to_text(message: BaseAgentEvent | BaseChatMessage, iterm: bool = False) -> str:
+    # to_text can be expensive, e.g. for a MultiModalMessage with
+    # iterm=True it base64-encodes every image. Cache the rendered text
+    # per message object so a message seen again is not re-rendered.
+    # Message models are not hashable, so key by id and evict the entry
+    # when the message is garbage collected.
+    key = id(message)
+    entry = _TO_TEXT_CACHE.get(key)
+    if entry is None:
+        texts: Dict[bool, str] = {}
+        entry = (weakref.ref(message, lambda _ref, _key=key: _TO_TEXT_CACHE.pop(_key, None)), texts)
+        _TO_TEXT_CACHE[key] = entry
+    texts = entry[1]
+    text = texts.get(iterm)
+    if text is None:
+        text = message.to_text(iterm=iterm) if isinstance(message, MultiModalMessage) else message.to_text()
+        texts[iterm] = text
+    return text
+
+
+def _write_stdout(output: str) -> None:
+    # Write directly on the event loop thread. For token-sized chunk text
+    # the thread-pool round-trip of ``aprint`` costs more than the write
+    # itself; heavier output still goes through ``aprint``.
+    sys.stdout.write(output)
+    sys.stdout.flush()
 
 
 async def Console(
@@ -107,96 +219,169 @@ async def Console(
             or a :class:`~autogen_agentchat.base.Response` if the stream is from :meth:`~autogen_agentchat.base.ChatAgent.on_messages_stream`.
     """
     render_image_iterm = _is_running_in_iterm() and _is_output_a_tty() and not no_inline_images
-    start_time = time.time()
-    total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+    # The duration is only reported when output_stats is on; skip the
+    # clock sampling entirely otherwise.
+    start_time = time.monotonic() if output_stats else 0.0
+    # Accumulate token totals as plain ints; only the two numbers are
+    # ever reported, so there is no need to go through a RequestUsage.
+    total_prompt_tokens = 0
+    total_completion_tokens = 0
 
     last_processed: Optional[T] = None
 
-    streaming_chunks: List[str] = []
+    # True while consuming a run of ModelClientStreamingChunkEvents.
+    in_stream: bool = False
+    pending_chunks: List[str] = []
+
+    def flush_pending_chunks() -> None:
+        if pending_chunks:
+            _write_stdout("".join(pending_chunks))
+            pending_chunks.clear()
+
+    # output_stats and render_image_iterm are fixed for the lifetime of
+    # the call, so resolve the branches they control here once instead of
+    # re-testing the flags for every message.
+    message_to_text = partial(_message_to_text, iterm=render_image_iterm)
+
+    if output_stats:
+
+        async def record_usage(usage: RequestUsage) -> None:
+            nonlocal total_prompt_tokens, total_completion_tokens
+            await aprint(
+                f"[Prompt tokens: {usage.prompt_tokens}, Completion tokens: {usage.completion_tokens}]",
+                end="\n",
+                flush=True,
+            )
+            total_completion_tokens += usage.completion_tokens
+            total_prompt_tokens += usage.prompt_tokens
+
+    else:
+
+        async def record_usage(usage: RequestUsage) -> None:
+            nonlocal total_prompt_tokens, total_completion_tokens
+            total_completion_tokens += usage.completion_tokens
+            total_prompt_tokens += usage.prompt_tokens
+
+    async def handle_task_result(message: TaskResult) -> None:
+        nonlocal last_processed
+        if output_stats:
+            duration = time.monotonic() - start_time
+            output = (
+                f"{'-' * 10} Summary {'-' * 10}\n"
+                f"Number of messages: {len(message.messages)}\n"
+                f"Finish reason: {message.stop_reason}\n"
+                f"Total prompt tokens: {total_prompt_tokens}\n"
+                f"Total completion tokens: {total_completion_tokens}\n"
+                f"Duration: {duration:.2f} seconds\n"
+            )
+            await aprint(output, end="", flush=True)
+
+        # mypy ignore
+        last_processed = message  # type: ignore
 
-    async for message in stream:
-        if isinstance(message, TaskResult):
-            duration = time.time() - start_time
+    async def handle_response(message: Response) -> None:
+        nonlocal last_processed, total_prompt_tokens, total_completion_tokens
+
+        # Print final response. The memoized renderer means a chat message
+        # that already passed through the stream (and, for MultiModal with
+        # inline images, was already base64-encoded) is not re-rendered.
+        final_content = message_to_text(message.chat_message)
+        output = f"{'-' * 10} {message.chat_message.source} {'-' * 10}\n{final_content}\n"
+        if message.chat_message.models_usage:
             if output_stats:
-                output = (
-                    f"{'-' * 10} Summary {'-' * 10}\n"
-                    f"Number of messages: {len(message.messages)}\n"
-                    f"Finish reason: {message.stop_reason}\n"
-                    f"Total prompt tokens: {total_usage.prompt_tokens}\n"
-                    f"Total completion tokens: {total_usage.completion_tokens}\n"
-                    f"Duration: {duration:.2f} seconds\n"
-                )
-                await aprint(output, end="", flush=True)
-
-            # mypy ignore
-            last_processed = message  # type: ignore
-
-        elif isinstance(message, Response):
-            duration = time.time() - start_time
-
-            # Print final response.
-            if isinstance(message.chat_message, MultiModalMessage):
-                final_content = message.chat_message.to_text(iterm=render_image_iterm)
+                output += f"[Prompt tokens: {message.chat_message.models_usage.prompt_tokens}, Completion tokens: {message.chat_message.models_usage.completion_tokens}]\n"
+            total_completion_tokens += message.chat_message.models_usage.completion_tokens
+            total_prompt_tokens += message.chat_message.models_usage.prompt_tokens
+        await aprint(output, end="", flush=True)
+
+        # Print summary.
+        if output_stats:
+            duration = time.monotonic() - start_time
+            if message.inner_messages is not None:
+                num_inner_messages = len(message.inner_messages)
             else:
-                final_content = message.chat_message.to_text()
-            output = f"{'-' * 10} {message.chat_message.source} {'-' * 10}\n{final_content}\n"
-            if message.chat_message.models_usage:
-                if output_stats:
-                    output += f"[Prompt tokens: {message.chat_message.models_usage.prompt_tokens}, Completion tokens: {message.chat_message.models_usage.completion_tokens}]\n"
-                total_usage.completion_tokens += message.chat_message.models_usage.completion_tokens
-                total_usage.prompt_tokens += message.chat_message.models_usage.prompt_tokens
+                num_inner_messages = 0
+            output = (
+                f"{'-' * 10} Summary {'-' * 10}\n"
+                f"Number of inner messages: {num_inner_messages}\n"
+                f"Total prompt tokens: {total_prompt_tokens}\n"
+                f"Total completion tokens: {total_completion_tokens}\n"
+                f"Duration: {duration:.2f} seconds\n"
+            )
             await aprint(output, end="", flush=True)
 
-            # Print summary.
-            if output_stats:
-                if message.inner_messages is not None:
-                    num_inner_messages = len(message.inner_messages)
-                else:
-                    num_inner_messages = 0
-                output = (
-                    f"{'-' * 10} Summary {'-' * 10}\n"
-                    f"Number of inner messages: {num_inner_messages}\n"
-                    f"Total prompt tokens: {total_usage.prompt_tokens}\n"
-                    f"Total completion tokens: {total_usage.completion_tokens}\n"
-                    f"Duration: {duration:.2f} seconds\n"
-                )
-                await aprint(output, end="", flush=True)
-
-            # mypy ignore
-            last_processed = message  # type: ignore
-        # We don't want to print UserInputRequestedEvent messages, we just use them to signal the user input event.
-        elif isinstance(message, UserInputRequestedEvent):
-            if user_input_manager is not None:
-                user_input_manager.notify_event_received(message.request_id)
+        # mypy ignore
+        last_processed = message  # type: ignore
+
+    # We don't want to print UserInputRequestedEvent messages, we just use them to signal the user input event.
+    async def handle_user_input_requested(message: UserInputRequestedEvent) -> None:
+        if user_input_manager is not None:
+            user_input_manager.notify_event_received(message.request_id)
+
+    async def print_sender(message: BaseAgentEvent | BaseChatMessage) -> None:
+        await aprint(f"{'-' * 10} {_type_name(type(message))} ({message.source}) {'-' * 10}", end="\n", flush=True)
+
+    async def handle_chunk(message: ModelClientStreamingChunkEvent) -> None:
+        nonlocal in_stream
+        if not in_stream:
+            # Print message sender.
+            await print_sender(message)
+            in_stream = True
+        pending_chunks.append(message.to_text())
+        if len(pending_chunks) >= _STREAMING_CHUNK_BATCH_SIZE:
+            flush_pending_chunks()
+
+    async def handle_message(message: BaseAgentEvent | BaseChatMessage) -> None:
+        nonlocal in_stream
+        if in_stream:
+            in_stream = False
+            # Chunked messages are already printed, so we just print a newline.
+            _write_stdout("\n")
         else:
-            # Cast required for mypy to be happy
-            message = cast(BaseAgentEvent | BaseChatMessage, message)  # type: ignore
-            if not streaming_chunks:
-                # Print message sender.
-                await aprint(
-                    f"{'-' * 10} {message.__class__.__name__} ({message.source}) {'-' * 10}", end="\n", flush=True
-                )
-            if isinstance(message, ModelClientStreamingChunkEvent):
-                await aprint(message.to_text(), end="", flush=True)
-                streaming_chunks.append(message.content)
+            # Print message sender.
+            await print_sender(message)
+            await aprint(message_to_text(message), end="\n", flush=True)
+        if message.models_usage:
+            await record_usage(message.models_usage)
+
+    # Dispatch on the exact message type with one dict lookup instead of
+    # walking an isinstance chain per message. Subclasses miss the table
+    # once, resolve through issubclass, and are cached for the next hit.
+    handlers: Dict[type, Callable[[Any], Awaitable[None]]] = {
+        TaskResult: handle_task_result,
+        Response: handle_response,
+        UserInputRequestedEvent: handle_user_input_requested,
+        ModelClientStreamingChunkEvent: handle_chunk,
+    }
+
+    def resolve_handler(message_type: type) -> Callable[[Any], Awaitable[None]]:
+        handler = handlers.get(message_type)
+        if handler is None:
+            if issubclass(message_type, TaskResult):
+                handler = handle_task_result
+            elif issubclass(message_type, Response):
+                handler = handle_response
+            elif issubclass(message_type, UserInputRequestedEvent):
+                handler = handle_user_input_requested
+            elif issubclass(message_type, ModelClientStreamingChunkEvent):
+                handler = handle_chunk
             else:
-                if streaming_chunks:
-                    streaming_chunks.clear()
-                    # Chunked messages are already printed, so we just print a newline.
-                    await aprint("", end="\n", flush=True)
-                elif isinstance(message, MultiModalMessage):
-                    await aprint(message.to_text(iterm=render_image_iterm), end="\n", flush=True)
-                else:
-                    await aprint(message.to_text(), end="\n", flush=True)
-                if message.models_usage:
-                    if output_stats:
-                        await aprint(
-                            f"[Prompt tokens: {message.models_usage.prompt_tokens}, Completion tokens: {message.models_usage.completion_tokens}]",
-                            end="\n",
-                            flush=True,
-                        )
-                    total_usage.completion_tokens += message.models_usage.completion_tokens
-                    total_usage.prompt_tokens += message.models_usage.prompt_tokens
+                handler = handle_message
+            handlers[message_type] = handler
+        return handler
+
+    try:
+        async for message, more_ready in _buffered(stream):
+            handler = resolve_handler(type(message))
+            if pending_chunks and handler is not handle_chunk:
+                flush_pending_chunks()
+            await handler(message)
+            if pending_chunks and not more_ready:
+                # The stream has drained, so show the buffered chunk text
+                # now instead of holding it until the batch fills up.
+                flush_pending_chunks()
+    finally:
+        flush_pending_chunks()
 
     if last_processed is None:
         raise ValueError("No TaskResult or Response was processed.")
@@ -0,0 +1,65 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, TextMessage
+from autogen_agentchat.ui import Console
+from autogen_agentchat.ui._console import _buffered  # pyright: ignore[reportPrivateUsage]
+
+
+class _ExplodingMessage(TextMessage):
+    def to_text(self) -> str:
+        raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_console_error_does_not_leak_prefetch_task() -> None:
+    """A Console run that dies mid-stream must not leave its prefetch task
+    permanently blocked on a full queue, which would hang event-loop
+    shutdown when asyncio.run cancels and gathers outstanding tasks."""
+
+    async def stream() -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
+        # Produce far ahead of the consumer so the prefetch queue is full
+        # and the pump task is blocked in queue.put when the error hits.
+        yield _ExplodingMessage(source="a", content="unused")
+        for i in range(20):
+            yield TextMessage(source="a", content=f"m{i}")
+        yield TaskResult(messages=[], stop_reason="done")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await Console(stream())
+
+    # Cancel whatever the failed run left behind, the way asyncio.run does
+    # at shutdown, and require every task to actually finish.
+    current = asyncio.current_task()
+    leftover = [task for task in asyncio.all_tasks() if task is not current]
+    for task in leftover:
+        task.cancel()
+    if leftover:
+        _, not_done = await asyncio.wait(leftover, timeout=5)
+        assert not not_done, "prefetch task still blocked after cancellation"
+
+
+@pytest.mark.asyncio
+async def test_buffered_pump_exits_on_cancel_with_full_queue() -> None:
+    """A single cancellation must terminate the prefetch task even while it
+    is blocked putting into a full queue; putting the sentinel from a
+    finally block here used to deadlock and hang event-loop shutdown."""
+
+    async def source() -> AsyncGenerator[int, None]:
+        for i in range(100):
+            yield i
+
+    before = asyncio.all_tasks()
+    stream = _buffered(source(), maxsize=2)
+    item, _ = await anext(stream)
+    assert item == 0
+    # Let the pump fill the queue and block in queue.put.
+    await asyncio.sleep(0.1)
+    pump_tasks = list(asyncio.all_tasks() - before)
+    assert len(pump_tasks) == 1
+    pump_tasks[0].cancel()
+    _, not_done = await asyncio.wait(pump_tasks, timeout=5)
+    assert not not_done, "pump task still blocked after cancellation"
+    await stream.aclose()
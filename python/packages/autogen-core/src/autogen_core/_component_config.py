@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import warnings
 from typing import Any, ClassVar, Dict, Generic, Literal, Type, TypeGuard, cast, overload
@@ -40,6 +41,15 @@ class ComponentModel(BaseModel):
     """The schema validated config field is passed to a given class's implmentation of :py:meth:`autogen_core.ComponentConfigImpl._from_config` to create a new instance of the component class."""
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve_provider_class(module_path: str, class_name: str) -> Any:
+    # Cached so repeated loads of the same provider skip the import
+    # machinery's locking and module lookup. Failed imports are not
+    # cached, so a retry after installing a dependency still works.
+    module = importlib.import_module(module_path)
+    return module.__getattribute__(class_name)
+
+
 def _type_to_provider_str(t: type) -> str:
     return f"{t.__module__}.{t.__qualname__}"
 
@@ -223,8 +233,7 @@ class ComponentLoader:
             raise ValueError("Invalid")
 
         module_path, class_name = output
-        module = importlib.import_module(module_path)
-        component_class = module.__getattribute__(class_name)
+        component_class = _resolve_provider_class(module_path, class_name)
 
         if not is_component_class(component_class):
             raise TypeError("Invalid component class")
@@ -1,7 +1,9 @@
 import asyncio
+import functools
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     AsyncGenerator,
     Awaitable,
@@ -40,6 +42,16 @@ DEFAULT_AGENT_COLOR = "white"
 AGENT_ALIGNMENTS: dict[str, AlignMethod] = {"user": "right", "MagenticOneOrchestrator": "center"}
 DEFAULT_AGENT_ALIGNMENT: AlignMethod = "left"
 
+# Shared console instance. Constructing a Console probes the terminal
+# (color system, encoding, legacy-windows checks), so reuse one instance
+# across calls instead of building a new one per run.
+_RICH_CONSOLE: Console = Console()
+
+# Console output is inherently serial (one stdout), so printing gets its
+# own single worker rather than fanning out over the default executor,
+# where concurrent runs would contend on Rich's internal buffer lock.
+_PRINT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rich-print")
+
 
 def _is_running_in_iterm() -> bool:
     return os.getenv("TERM_PROGRAM") == "iTerm.app"
@@ -53,7 +65,14 @@ T = TypeVar("T", bound=TaskResult | Response)
 
 
 def aprint(output: str, end: str = "\n") -> Awaitable[None]:
-    return asyncio.to_thread(print, output, end=end)
+    return asyncio.get_running_loop().run_in_executor(_PRINT_EXECUTOR, functools.partial(print, output, end=end))
+
+
+def _write_stdout(output: str) -> None:
+    # Streaming chunk text bypasses Rich entirely: formatting token-sized
+    # fragments per chunk would re-parse markup and reflow on every token.
+    sys.stdout.write(output)
+    sys.stdout.flush()
 
 
 def _extract_message_content(message: BaseAgentEvent | BaseChatMessage) -> Tuple[List[str], List[Image]]:
@@ -66,19 +85,27 @@ def _extract_message_content(message: BaseAgentEvent | BaseChatMessage) -> Tuple
     return text_parts, image_parts
 
 
-async def _aprint_panel(console: Console, text: str, title: str) -> None:
-    color = AGENT_COLORS.get(title, DEFAULT_AGENT_COLOR)
-    title_align = AGENT_ALIGNMENTS.get(title, DEFAULT_AGENT_ALIGNMENT)
+@functools.lru_cache(maxsize=128)
+def _panel_style(title: str) -> Tuple[str, AlignMethod]:
+    # A run only sees a handful of distinct sources, so cache the
+    # per-source style lookups instead of redoing them per message.
+    return AGENT_COLORS.get(title, DEFAULT_AGENT_COLOR), AGENT_ALIGNMENTS.get(title, DEFAULT_AGENT_ALIGNMENT)
 
-    await asyncio.to_thread(
-        console.print,
-        Panel(
-            text,
-            title=title,
-            title_align=title_align,
-            border_style=color,
-        ),
-    )
+
+@functools.lru_cache(maxsize=128)
+def _panel_factory(title: str) -> "functools.partial[Panel]":
+    # Pre-bind the static Panel arguments once per source so per-message
+    # construction only supplies the text.
+    color, title_align = _panel_style(title)
+    return functools.partial(Panel, title=title, title_align=title_align, border_style=color)
+
+
+async def _aprint_panel(console: Console, text: str, title: str) -> None:
+    # Construct the Panel in the worker as well: its allocation grows with
+    # the text size, and deferring it keeps the event loop thread free for
+    # incoming stream events.
+    factory = _panel_factory(title)
+    await asyncio.get_running_loop().run_in_executor(_PRINT_EXECUTOR, lambda: console.print(factory(text)))
 
 
 async def _aprint_message_content(
@@ -129,11 +156,19 @@ async def RichConsole(
     render_image_iterm = _is_running_in_iterm() and _is_output_a_tty() and not no_inline_images
     start_time = time.time()
     total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
-    rich_console = Console()
+    rich_console = _RICH_CONSOLE
 
     last_processed: Optional[T] = None
 
+    # True while consuming a run of ModelClientStreamingChunkEvents.
+    in_stream: bool = False
+
     async for message in stream:
+        if in_stream and not isinstance(message, ModelClientStreamingChunkEvent):
+            # End the raw progress line; the completed message that
+            # follows is rendered as a single Panel.
+            _write_stdout("\n")
+            in_stream = False
         if isinstance(message, TaskResult):
             duration = time.time() - start_time
             if output_stats:
@@ -187,8 +222,11 @@ async def RichConsole(
             if user_input_manager is not None:
                 user_input_manager.notify_event_received(message.request_id)
         elif isinstance(message, ModelClientStreamingChunkEvent):
-            # TODO: Handle model client streaming chunk events.
-            pass
+            # Show streaming progress as raw text; once the stream ends,
+            # the finalized message is rendered as one Panel from the full
+            # text rather than reflowing a Panel per chunk.
+            _write_stdout(message.to_text())
+            in_stream = True
         else:
             # Cast required for mypy to be happy
             message = cast(BaseAgentEvent | BaseChatMessage, message)  # type: ignore